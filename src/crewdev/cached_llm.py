@@ -0,0 +1,56 @@
+from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+
+from crewai import LLM
+
+
+class CachedLLM(LLM):
+    """
+    LLM that answers a prompt it has already seen from memory instead of calling the model.
+
+    Only plain text completions are cached; calls that carry tools or available
+    functions always go to the model because answering them may run functions.
+    """
+
+    def __init__(self, *args, cache_size: int = 2048, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache_size = cache_size
+        self._responses: "OrderedDict[str, str]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+
+    def _cache_key(self, messages: Union[str, List[Dict[str, str]]], from_agent: Optional[Any]) -> str:
+        role = getattr(from_agent, "role", None)
+        payload = json.dumps([self.model, role, messages], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        if tools or available_functions:
+            return super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        key = self._cache_key(messages, from_agent)
+        with self._responses_lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        response = super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        if isinstance(response, str) and response:
+            with self._responses_lock:
+                self._responses[key] = response
+                self._responses.move_to_end(key)
+                while len(self._responses) > self._cache_size:
+                    self._responses.popitem(last=False)
+        return response
@@ -0,0 +1,41 @@
+from typing import Any, Dict, Mapping, Union
+from functools import lru_cache
+import copy
+import os
+import types
+import yaml
+
+try:
+    _Loader = yaml.CSafeLoader
+except AttributeError:
+    _Loader = yaml.SafeLoader
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(config_path: str, mtime_ns: int, size: int) -> Any:
+    with open(config_path, "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=_Loader)
+
+
+def load_yaml_config(config_path, readonly: bool = False) -> Union[Dict, Mapping]:
+    """
+    Load a YAML config file, parsing it only once per process until the file changes.
+
+    A change is detected from the file's mtime and size, so an edit that lands within the
+    filesystem's timestamp granularity is still picked up as long as the length differs.
+
+    The cached document is never handed out directly: CrewBase interpolates inputs
+    into the configs in place, so every caller gets its own deep copy. Callers that only
+    read the config can pass readonly=True to get a read-only view of the shared document
+    instead; the nested mappings inside it must be treated as read-only too.
+    """
+    path = os.fspath(config_path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        print(f"File not found: {config_path}")
+        raise
+    parsed = _parse_yaml(path, st.st_mtime_ns, st.st_size)
+    if readonly:
+        return types.MappingProxyType(parsed)
+    return copy.deepcopy(parsed)
@@ -1,11 +1,15 @@
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Crew, LLM, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crewai.utilities.events import TaskStartedEvent, crewai_event_bus
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
+from functools import lru_cache
 import os
 import sys
+import queue
+import atexit
 import logging
-from langchain_ollama import OllamaLLM
+import logging.handlers
 
 # Import all our custom tools
 from crewdev.tools import (
@@ -21,26 +25,169 @@ from crewdev.tools import (
 
 # Import dynamic task manager
 from crewdev.dynamic_task_manager import DynamicTaskManager
+from crewdev.config_loader import load_yaml_config
+from crewdev.cached_llm import CachedLLM
+from crewdev.log_queue import BatchedStreamHandler, BatchingQueueListener, shared_file_handler
+from crewdev.settings import max_tokens, memory_enabled, ollama_model, parallel_tasks, pause_enabled, task_limit
 # If you want to run a snippet of code before or after the crew starts,
 # you can use the @before_kickoff and @after_kickoff decorators
 # https://docs.crewai.com/concepts/crews#example-crew-class-with-decorators
-os.environ["LITELLM_PROVIDER"] = "ollama"
+# Ollama model with the ollama/ prefix (CREWDEV_OLLAMA_MODEL, see crewdev.settings)
+_MODEL = ollama_model()
 
-# Set environment variables to use Ollama
+# Set environment variables to use Ollama in a single update.
 # For Ollama with CrewAI, use only OpenAI-compatible environment variables
-os.environ["OPENAI_API_BASE"] = "http://localhost:11434/v1"
-os.environ["OPENAI_API_KEY"] = "ollama"  # Dummy key for Ollama
-# Remove OLLAMA_BASE_URL - CrewAI uses Langchain which expects OpenAI-style APIs
-os.environ["LLM_MODEL"] = "ollama/mistral:latest"  # Using Mistral with ollama/ prefix
-# Additional environment variables to ensure correct model usage
-os.environ["DEFAULT_MODEL"] = "ollama/mistral:latest"
-os.environ["MODEL_NAME"] = "ollama/mistral:latest"
-
-gptoss = OllamaLLM(
-    model="ollama/mistral:latest",
-    url="http://localhost:11434",
-    provider="ollama",
-)
+# (no OLLAMA_BASE_URL - CrewAI uses Langchain which expects OpenAI-style APIs).
+# MODEL_NAME is what CrewAI falls back to when an agent has no explicit llm.
+os.environ.update({
+    "LITELLM_PROVIDER": "ollama",
+    "OPENAI_API_BASE": "http://localhost:11434/v1",
+    "OPENAI_API_KEY": "ollama",  # Dummy key for Ollama
+    "LLM_MODEL": _MODEL,
+    "MODEL_NAME": _MODEL,
+})
+
+# Crew memory embeds through the local Ollama server too; CrewAI would otherwise call OpenAI
+_EMBEDDER = {
+    "provider": "ollama",
+    "config": {
+        "model": os.environ.get("CREWDEV_EMBEDDER_MODEL", "nomic-embed-text"),
+        "url": "http://localhost:11434/api/embeddings",
+    },
+}
+
+# Implementation tasks that only depend on the architecture and can run concurrently
+_PARALLEL_TASKS = frozenset({
+    "frontend_implementation_task",
+    "backend_implementation_task",
+    "devops_setup_task",
+})
+
+# Task labels by task name in pipeline order, used to announce task boundaries
+_TASK_LABELS = {
+    "market_research_task": "📈 Market Research Task",
+    "technical_architecture_task": "🏗️ Technical Architecture Task",
+    "frontend_implementation_task": "🎨 Frontend Implementation Task",
+    "backend_implementation_task": "⚙️ Backend Implementation Task",
+    "devops_setup_task": "🚀 DevOps Setup Task",
+    "technical_skeptic_review_task": "🤨 Technical Skeptic Review Task",
+    "code_review_task": "🔍 Code Review Task",
+    "final_integration_task": "🎯 Final Integration Task",
+}
+
+# Step-callback prefix and tool classes for each agent
+_AGENT_SPECS = {
+    "staff_engineer": ("🤔 Staff Engineer thinking:", (
+        # File management tools
+        ReadFileTool, WriteFileTool, FileWriterTool, ListDirectoryTool, CreateDirectoryTool, DeleteFileTool, FileExistsTool,
+        # Project creation tools
+        CreateProjectTool, CreateRequirementsTool, CreateGitignoreTool,
+        # Execution tools
+        RunCommandTool, CheckPortTool,
+        # Development tools
+        CreateDockerfileTool, CreateDockerComposeTool,
+    )),
+    "senior_engineer_frontend": ("🎨 Frontend Engineer thinking:", (
+        # File management tools
+        ReadFileTool, WriteFileTool, FileWriterTool, ListDirectoryTool, CreateDirectoryTool, DeleteFileTool, FileExistsTool,
+        # Frontend-specific tools
+        CreatePackageJsonTool, CreateGitignoreTool,
+        # Execution tools
+        RunCommandTool, StartServerTool, StopServerTool, ListServersTool, CheckPortTool,
+        # Package management
+        InstallPackageTool,
+    )),
+    "senior_engineer_backend": ("⚙️ Backend Engineer thinking:", (
+        # File management tools
+        ReadFileTool, WriteFileTool, FileWriterTool, ListDirectoryTool, CreateDirectoryTool, DeleteFileTool, FileExistsTool,
+        # Backend-specific tools
+        CreateRequirementsTool, CreateGitignoreTool,
+        # Execution tools
+        RunCommandTool, StartServerTool, StopServerTool, ListServersTool, CheckPortTool,
+        # Python-specific tools
+        RunPythonScriptTool, InstallPackageTool,
+        # Development tools
+        CreateDockerfileTool,
+    )),
+    "senior_engineer_devops": ("🚀 DevOps Engineer thinking:", (
+        # File management tools
+        ReadFileTool, WriteFileTool, FileWriterTool, ListDirectoryTool, CreateDirectoryTool, DeleteFileTool, FileExistsTool,
+        # DevOps-specific tools
+        CreateDockerfileTool, CreateDockerComposeTool, CreateGitignoreTool,
+        # Execution tools
+        RunCommandTool, StartServerTool, StopServerTool, ListServersTool, CheckPortTool,
+        # Package management
+        InstallPackageTool,
+    )),
+    "technical_skeptic": ("🤨 Technical Skeptic thinking:", (
+        # File management tools for code review
+        ReadFileTool, ListDirectoryTool, FileExistsTool,
+        # Execution tools for testing
+        RunCommandTool, RunPythonScriptTool,
+        # Development tools for analysis
+        CheckPortTool,
+    )),
+    "product_manager": ("📊 Product Manager thinking:", (
+        # File management tools for documentation
+        ReadFileTool, WriteFileTool, FileWriterTool, ListDirectoryTool, CreateDirectoryTool,
+        # Project creation tools
+        CreateProjectTool, CreateGitignoreTool,
+        # Basic execution tools
+        RunCommandTool,
+    )),
+}
+
+# Agent thoughts and task results are handed to a background listener thread so
+# step callbacks (possibly from concurrent tasks) never block on stdout or disk
+_thought_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_thought_logger = logging.getLogger("crewdev.thoughts")
+_thought_logger.setLevel(logging.INFO)
+_thought_logger.addHandler(logging.handlers.QueueHandler(_thought_queue))
+_thought_logger.propagate = False
+_thought_listener = None
+
+
+def _start_thought_listener() -> None:
+    """Start the thought log listener once, writing to the console and crew_thought_process.log."""
+    global _thought_listener
+    if _thought_listener is not None:
+        return
+    console_handler = BatchedStreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+    _thought_listener = BatchingQueueListener(_thought_queue, console_handler, shared_file_handler())
+    _thought_listener.start()
+    # Flush anything still queued when the process exits
+    atexit.register(_thought_listener.stop)
+
+
+def _log(prefix: str, message) -> None:
+    _thought_logger.info("%s %s", prefix, message)
+
+
+def _announce_task_start(source, event: TaskStartedEvent) -> None:
+    """Log a task's start as the task itself begins, so concurrently started tasks are named correctly."""
+    label = _TASK_LABELS.get(getattr(event.task, "name", None))
+    if label:
+        _log("▶️ Starting", f"{label} …")
+
+
+crewai_event_bus.register_handler(TaskStartedEvent, _announce_task_start)
+
+
+@lru_cache(maxsize=1)
+def _shared_llm() -> LLM:
+    """One LLM client for every agent and the crew.
+
+    CrewAI rebuilds foreign LLM objects (such as langchain's OllamaLLM) into a
+    fresh crewai.LLM per agent, whereas a crewai.LLM instance is used as-is.
+    """
+    # Optionally answer repeated prompts from memory instead of the model
+    use_cache = os.environ.get("CREWDEV_LLM_CACHE", "0").strip() in ("1", "true", "True")
+    llm_cls = CachedLLM if use_cache else LLM
+    # Optionally stream tokens; CrewAI's console listener prints chunks as they arrive
+    stream = os.environ.get("CREWDEV_STREAM", "0").strip() in ("1", "true", "True")
+    # Optionally cap tokens generated per turn (litellm maps this to Ollama's num_predict)
+    return llm_cls(model=_MODEL, base_url="http://localhost:11434", max_tokens=max_tokens(), stream=stream)
 
 
 @CrewBase
@@ -52,6 +199,7 @@ class SoftwareEngineeringTeam():
     
     def __init__(self):
         super().__init__()
+        _start_thought_listener()
         # Initialize dynamic task manager
         self.task_manager = DynamicTaskManager()
         
@@ -61,42 +209,45 @@ class SoftwareEngineeringTeam():
         self.bug_report_tool = BugReportTool(self.task_manager)
         self.feature_request_tool = FeatureRequestTool(self.task_manager)
 
-        # Track task start/end to log clearly at boundaries
-        self._task_order = [
-            ("📈 Market Research Task", "product_manager"),
-            ("🏗️ Technical Architecture Task", "staff_engineer"),
-            ("🎨 Frontend Implementation Task", "senior_engineer_frontend"),
-            ("⚙️ Backend Implementation Task", "senior_engineer_backend"),
-            ("🚀 DevOps Setup Task", "senior_engineer_devops"),
-            ("🤨 Technical Skeptic Review Task", "technical_skeptic"),
-            ("🔍 Code Review Task", "staff_engineer"),
-            ("🎯 Final Integration Task", "product_manager"),
-        ]
-        self._started_task_count = 0
-        self._completed_task_count = 0
+        # Labels used to announce task boundaries
+        self._task_labels = _TASK_LABELS
+
+        # Pause settings are read once per team rather than at every task boundary
+        self._pause_enabled = pause_enabled()
+        self._pause_window_secs = 10
+        try:
+            timeout_env = os.environ.get("CREWDEV_PAUSE_WINDOW_SECS")
+            if timeout_env:
+                self._pause_window_secs = max(1, int(timeout_env))
+        except Exception:
+            pass
+        project_name = os.environ.get("CREWDEV_PROJECT_NAME", "<unknown>")
+        self._pause_project_path = f"projects/{project_name}" if project_name else "projects/<unknown>"
+
+        # Fan the implementation tasks out concurrently unless disabled or pausing
+        self._parallel_tasks = parallel_tasks()
+
+        # Memory costs an embedding call and vector store write per step; allow turning it off
+        self._memory = memory_enabled()
+
+        # CrewAI's verbose panels repeat every step in full; the step callbacks already report progress
+        self._verbose = os.environ.get("CREWDEV_VERBOSE", "0").strip() in ("1", "true", "True")
 
     def _pause_prompt(self, task_name: str) -> None:
         """Offer a short window to pause after a task; continue automatically if no input."""
+        if not self._pause_enabled:
+            return
         try:
-            should_pause = os.environ.get("CREWDEV_PAUSE_BETWEEN_TASKS", "0").strip() in ("1", "true", "True")
-            if not should_pause:
-                return
+            # Let queued thought output reach the console before prompting. The listener takes a
+            # record off the queue before writing it, so wait for task_done() rather than an empty queue.
+            _thought_queue.join()
 
-            project_name = os.environ.get("CREWDEV_PROJECT_NAME", "<unknown>")
-            project_path = f"projects/{project_name}" if project_name else "projects/<unknown>"
             print("\n---")
             print(f"After {task_name}.")
-            print(f"Type anything and press Enter within 10s to PAUSE, otherwise it will continue.")
-            print(f"Inspect path: {project_path}")
-            timeout_secs = 10
-            try:
-                timeout_env = os.environ.get("CREWDEV_PAUSE_WINDOW_SECS")
-                if timeout_env:
-                    timeout_secs = max(1, int(timeout_env))
-            except Exception:
-                pass
+            print(f"Type anything and press Enter within {self._pause_window_secs}s to PAUSE, otherwise it will continue.")
+            print(f"Inspect path: {self._pause_project_path}")
 
-            user_line = self._timed_input(f"pause?> ", timeout_secs)
+            user_line = self._timed_input(f"pause?> ", self._pause_window_secs)
             if user_line is not None:
                 print("\nPaused. When ready, press Enter to continue...")
                 try:
@@ -113,47 +264,40 @@ class SoftwareEngineeringTeam():
     def _make_task_callback(self, label: str):
         """Create a task callback that logs completion and optionally pauses."""
         def _callback(result: str) -> None:
-            print(f"{label} completed: {result}")
-            try:
-                logging.info(f"{label} completed")
-            except Exception:
-                pass
-            # Mark completion so the next agent step can announce the next task start
-            try:
-                self._completed_task_count += 1
-                # Immediately announce and mark the start of the next task for visibility
-                if self._completed_task_count < len(self._task_order):
-                    next_label, _ = self._task_order[self._completed_task_count]
-                    print(f"▶️ Starting {next_label} …")
-                    try:
-                        logging.info(f"Starting {next_label}")
-                    except Exception:
-                        pass
-                    # Keep counters aligned so step callbacks don't duplicate
-                    if self._started_task_count < self._completed_task_count + 1:
-                        self._started_task_count = self._completed_task_count + 1
-            except Exception:
-                pass
+            _log(f"{label} completed:", result)
             self._pause_prompt(label)
         return _callback
 
     def _make_step_callback(self, agent_key: str, prefix: str):
-        """Create an agent step callback that logs task start once per task."""
+        """Create an agent step callback that logs the agent's thoughts."""
         def _callback(message: str) -> None:
-            try:
-                if self._started_task_count == self._completed_task_count and self._started_task_count < len(self._task_order):
-                    next_label, _ = self._task_order[self._started_task_count]
-                    print(f"▶️ Starting {next_label} …")
-                    try:
-                        logging.info(f"Starting {next_label}")
-                    except Exception:
-                        pass
-                    self._started_task_count += 1
-            except Exception:
-                pass
-            print(f"{prefix} {message}")
+            _log(prefix, message)
         return _callback
 
+    def _apply_parallel_stage(self, tasks: List[Task]) -> None:
+        """Run the implementation tasks concurrently while keeping their context intact.
+
+        CrewAI only hands the last synchronous output to async tasks and then
+        replaces the running context with the async outputs, so every task gets
+        an explicit context matching what a sequential run would have passed.
+        """
+        for t in tasks:
+            t.async_execution = t.name in _PARALLEL_TASKS
+        # A crew may end with at most one async task (e.g. under CREWDEV_TASK_LIMIT)
+        for t in reversed(tasks):
+            if not t.async_execution:
+                break
+            t.async_execution = False
+
+        upstream: List[Task] = []
+        barrier: List[Task] = []  # upstream as of the last synchronous task
+        for t in tasks:
+            # Async tasks cannot depend on siblings running in the same group
+            t.context = list(barrier if t.async_execution else upstream)
+            upstream.append(t)
+            if not t.async_execution:
+                barrier = list(upstream)
+
     def _timed_input(self, prompt: str, timeout_secs: int):
         """Read a line from stdin with timeout. Returns the line or None on timeout."""
         try:
@@ -178,139 +322,45 @@ class SoftwareEngineeringTeam():
     # https://docs.crewai.com/concepts/agents#agent-tools
     @agent
     def staff_engineer(self) -> Agent:
-        return Agent(
-            config=self.agents_config['staff_engineer'], # type: ignore[index]
-            verbose=True,
-            allow_delegation=False,
-            step_callback=self._make_step_callback("staff_engineer", "🤔 Staff Engineer thinking:"),
-            memory=True,
-            llm=gptoss,
-            tools=[
-                # File management tools
-                ReadFileTool(), WriteFileTool(), FileWriterTool(), ListDirectoryTool(), CreateDirectoryTool(), DeleteFileTool(), FileExistsTool(),
-                # Project creation tools
-                CreateProjectTool(), CreateRequirementsTool(), CreateGitignoreTool(),
-                # Execution tools
-                RunCommandTool(), CheckPortTool(),
-                # Development tools
-                CreateDockerfileTool(), CreateDockerComposeTool(),
-                # Dynamic task tools
-                self.dynamic_task_tool, self.task_completion_tool, self.bug_report_tool, self.feature_request_tool
-            ]
-        )
+        return self._build_agent('staff_engineer')
 
     @agent
     def senior_engineer_frontend(self) -> Agent:
-        return Agent(
-            config=self.agents_config['senior_engineer_frontend'], # type: ignore[index]
-            verbose=True,
-            allow_delegation=False,
-            step_callback=self._make_step_callback("senior_engineer_frontend", "🎨 Frontend Engineer thinking:"),
-            memory=True,
-            llm=gptoss,
-            tools=[
-                # File management tools
-                ReadFileTool(), WriteFileTool(), FileWriterTool(), ListDirectoryTool(), CreateDirectoryTool(), DeleteFileTool(), FileExistsTool(),
-                # Frontend-specific tools
-                CreatePackageJsonTool(), CreateGitignoreTool(),
-                # Execution tools
-                RunCommandTool(), StartServerTool(), StopServerTool(), ListServersTool(), CheckPortTool(),
-                # Package management
-                InstallPackageTool(),
-                # Dynamic task tools
-                self.dynamic_task_tool, self.task_completion_tool, self.bug_report_tool, self.feature_request_tool
-            ]
-        )
+        return self._build_agent('senior_engineer_frontend')
 
     @agent
     def senior_engineer_backend(self) -> Agent:
-        return Agent(
-            config=self.agents_config['senior_engineer_backend'], # type: ignore[index]
-            verbose=True,
-            allow_delegation=False,
-            step_callback=self._make_step_callback("senior_engineer_backend", "⚙️ Backend Engineer thinking:"),
-            memory=True,
-            llm=gptoss,
-            tools=[
-                # File management tools
-                ReadFileTool(), WriteFileTool(), FileWriterTool(), ListDirectoryTool(), CreateDirectoryTool(), DeleteFileTool(), FileExistsTool(),
-                # Backend-specific tools
-                CreateRequirementsTool(), CreateGitignoreTool(),
-                # Execution tools
-                RunCommandTool(), StartServerTool(), StopServerTool(), ListServersTool(), CheckPortTool(),
-                # Python-specific tools
-                RunPythonScriptTool(), InstallPackageTool(),
-                # Development tools
-                CreateDockerfileTool(),
-                # Dynamic task tools
-                self.dynamic_task_tool, self.task_completion_tool, self.bug_report_tool, self.feature_request_tool
-            ]
-        )
+        return self._build_agent('senior_engineer_backend')
 
     @agent
     def senior_engineer_devops(self) -> Agent:
-        return Agent(
-            config=self.agents_config['senior_engineer_devops'], # type: ignore[index]
-            verbose=True,
-            allow_delegation=False,
-            step_callback=self._make_step_callback("senior_engineer_devops", "🚀 DevOps Engineer thinking:"),
-            memory=True,
-            llm=gptoss,
-            tools=[
-                # File management tools
-                ReadFileTool(), WriteFileTool(), FileWriterTool(), ListDirectoryTool(), CreateDirectoryTool(), DeleteFileTool(), FileExistsTool(),
-                # DevOps-specific tools
-                CreateDockerfileTool(), CreateDockerComposeTool(), CreateGitignoreTool(),
-                # Execution tools
-                RunCommandTool(), StartServerTool(), StopServerTool(), ListServersTool(), CheckPortTool(),
-                # Package management
-                InstallPackageTool(),
-                # Dynamic task tools
-                self.dynamic_task_tool, self.task_completion_tool, self.bug_report_tool, self.feature_request_tool
-            ]
-        )
+        return self._build_agent('senior_engineer_devops')
 
     @agent
     def technical_skeptic(self) -> Agent:
-        return Agent(
-            config=self.agents_config['technical_skeptic'], # type: ignore[index]
-            verbose=True,
-            allow_delegation=False,
-            step_callback=self._make_step_callback("technical_skeptic", "🤨 Technical Skeptic thinking:"),
-            memory=True,
-            llm=gptoss,
-            tools=[
-                # File management tools for code review
-                ReadFileTool(), ListDirectoryTool(), FileExistsTool(),
-                # Execution tools for testing
-                RunCommandTool(), RunPythonScriptTool(),
-                # Development tools for analysis
-                CheckPortTool(),
-                # Dynamic task tools
-                self.dynamic_task_tool, self.task_completion_tool, self.bug_report_tool, self.feature_request_tool
-            ]
-        )
+        return self._build_agent('technical_skeptic')
 
     @agent
     def product_manager(self) -> Agent:
-        return Agent(
-            config=self.agents_config['product_manager'], # type: ignore[index]
-            verbose=True,
+        return self._build_agent('product_manager')
+
+    def _build_agent(self, name: str) -> Agent:
+        """Create an agent from its YAML config and its _AGENT_SPECS entry, plus the dynamic task tools."""
+        prefix, tool_classes = _AGENT_SPECS[name]
+        built = Agent(
+            config=self.agents_config[name], # type: ignore[index]
+            verbose=self._verbose,
             allow_delegation=False,
-            step_callback=self._make_step_callback("product_manager", "📊 Product Manager thinking:"),
-            memory=True,
-            llm=gptoss,
-            tools=[
-                # File management tools for documentation
-                ReadFileTool(), WriteFileTool(), FileWriterTool(), ListDirectoryTool(), CreateDirectoryTool(),
-                # Project creation tools
-                CreateProjectTool(), CreateGitignoreTool(),
-                # Basic execution tools
-                RunCommandTool(),
+            step_callback=self._make_step_callback(name, prefix),
+            llm=_shared_llm(),
+            tools=[tool_cls() for tool_cls in tool_classes] + [
                 # Dynamic task tools
                 self.dynamic_task_tool, self.task_completion_tool, self.bug_report_tool, self.feature_request_tool
             ]
         )
+        # Tasks the task manager creates for this agent name are handed to this agent
+        self.task_manager.register_agent(name, built)
+        return built
 
     # To learn more about structured task outputs,
     # task dependencies, and task callbacks, check out the documentation:
@@ -319,56 +369,56 @@ class SoftwareEngineeringTeam():
     def market_research_task(self) -> Task:
         return Task(
             config=self.tasks_config['market_research_task'], # type: ignore[index]
-            callback=self._make_task_callback("📈 Market Research Task")
+            callback=self._make_task_callback(_TASK_LABELS["market_research_task"])
         )
 
     @task
     def technical_architecture_task(self) -> Task:
         return Task(
             config=self.tasks_config['technical_architecture_task'], # type: ignore[index]
-            callback=self._make_task_callback("🏗️ Technical Architecture Task")
+            callback=self._make_task_callback(_TASK_LABELS["technical_architecture_task"])
         )
 
     @task
     def frontend_implementation_task(self) -> Task:
         return Task(
             config=self.tasks_config['frontend_implementation_task'], # type: ignore[index]
-            callback=self._make_task_callback("🎨 Frontend Implementation Task")
+            callback=self._make_task_callback(_TASK_LABELS["frontend_implementation_task"])
         )
 
     @task
     def backend_implementation_task(self) -> Task:
         return Task(
             config=self.tasks_config['backend_implementation_task'], # type: ignore[index]
-            callback=self._make_task_callback("⚙️ Backend Implementation Task")
+            callback=self._make_task_callback(_TASK_LABELS["backend_implementation_task"])
         )
 
     @task
     def devops_setup_task(self) -> Task:
         return Task(
             config=self.tasks_config['devops_setup_task'], # type: ignore[index]
-            callback=self._make_task_callback("🚀 DevOps Setup Task")
+            callback=self._make_task_callback(_TASK_LABELS["devops_setup_task"])
         )
 
     @task
     def technical_skeptic_review_task(self) -> Task:
         return Task(
             config=self.tasks_config['technical_skeptic_review_task'], # type: ignore[index]
-            callback=self._make_task_callback("🤨 Technical Skeptic Review Task")
+            callback=self._make_task_callback(_TASK_LABELS["technical_skeptic_review_task"])
         )
 
     @task
     def code_review_task(self) -> Task:
         return Task(
             config=self.tasks_config['code_review_task'], # type: ignore[index]
-            callback=self._make_task_callback("🔍 Code Review Task")
+            callback=self._make_task_callback(_TASK_LABELS["code_review_task"])
         )
 
     @task
     def final_integration_task(self) -> Task:
         return Task(
             config=self.tasks_config['final_integration_task'], # type: ignore[index]
-            callback=self._make_task_callback("🎯 Final Integration Task"),
+            callback=self._make_task_callback(_TASK_LABELS["final_integration_task"]),
             output_file='project_deliverables.md'
         )
 
@@ -378,29 +428,18 @@ class SoftwareEngineeringTeam():
         # To learn how to add knowledge sources to your crew, check out the documentation:
         # https://docs.crewai.com/concepts/knowledge#what-is-knowledge
 
-        # Create Ollama LLM instance directly
-        ollama_llm = OllamaLLM(
-            model="ollama/mistral:latest",
-            url="http://localhost:11434",
-            verbose=True
-        )
-
         # Optionally limit number of tasks for faster debug iterations
-        try:
-            import os
-            limit_env = os.environ.get("CREWDEV_TASK_LIMIT")
-            if limit_env is not None:
-                limit = max(1, int(limit_env))
-                limited_tasks = self.tasks[:limit]
-            else:
-                limited_tasks = self.tasks
-        except Exception:
-            limited_tasks = self.tasks
+        limit = task_limit()
+        limited_tasks = self.tasks[:limit] if limit else self.tasks
+
+        if self._parallel_tasks:
+            self._apply_parallel_stage(limited_tasks)
 
         print("Planned tasks:")
         for t in limited_tasks:
             try:
-                print(f" - {t.description.splitlines()[0][:100]}")
+                first_line = t.description.partition("\n")[0]
+                print(f" - {first_line[:100]}")
             except Exception:
                 pass
 
@@ -408,8 +447,13 @@ class SoftwareEngineeringTeam():
             agents=self.agents, # Automatically created by the @agent decorator
             tasks=limited_tasks, # Automatically created by the @task decorator
             process=Process.sequential,
-            verbose=True,
-            memory=True,
-            llm=ollama_llm,
+            verbose=self._verbose,
+            memory=self._memory,
+            embedder=_EMBEDDER,
+            llm=_shared_llm(),
             temperature=0.7
         )
+
+
+# Reuse parsed agents/tasks YAML across team instances instead of re-reading it each time
+SoftwareEngineeringTeam.load_yaml = staticmethod(load_yaml_config)
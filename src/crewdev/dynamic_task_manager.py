@@ -1,8 +1,70 @@
-from typing import Dict, List, Optional, Any
-from crewai import Task, Agent
-import yaml
-import os
-from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Any, Tuple
+from crewdev.config_loader import load_yaml_config
+from functools import lru_cache
+import copy
+import itertools
+from string import Formatter
+import sys
+
+if TYPE_CHECKING:
+    from crewai import Task
+
+# Which task each agent picks up in the implementation and review phases
+IMPLEMENTATION_TASKS = {
+    'senior_engineer_frontend': 'frontend_implementation_task',
+    'senior_engineer_backend': 'backend_implementation_task',
+    'senior_engineer_devops': 'devops_setup_task',
+}
+REVIEW_TASKS = {
+    'technical_skeptic': 'technical_skeptic_review_task',
+    'staff_engineer': 'code_review_task',
+}
+# Agents that pick up pending bugs and feature requests
+ISSUE_AGENTS = ('senior_engineer_frontend', 'senior_engineer_backend')
+
+# Default values for common template variables
+DEFAULT_TASK_PARAMS = {
+    'project_name': 'the project',
+    'bug_description': 'the reported issue',
+    'feature_description': 'the requested feature',
+    'research_topic': 'the technical topic',
+    'assigned_agent': 'staff_engineer'
+}
+
+_FORMATTER = Formatter()
+
+
+@lru_cache(maxsize=None)
+def _parse_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str], Optional[str], Optional[str]], ...]]:
+    """
+    Split a str.format template into (literal, field, spec, conversion) segments once.
+
+    Returns None for templates only str.format itself renders correctly: nested
+    replacement fields in a format spec ('{x:{w}}') and automatic or positional
+    fields ('{}', '{0}').
+    """
+    segments = tuple(_FORMATTER.parse(template))
+    for _, field, spec, _ in segments:
+        if field is not None and ('{' in spec or not field or field[0].isdigit()):
+            return None
+    return segments
+
+
+def _render_template(template: str, params: Dict[str, Any]) -> str:
+    """Render template.format(**params), reusing the parsed template where possible."""
+    segments = _parse_template(template)
+    if segments is None:
+        return template.format(**params)
+    parts = []
+    for literal, field, spec, conversion in segments:
+        parts.append(literal)
+        if field is not None:
+            value = _FORMATTER.get_field(field, (), params)[0]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, spec))
+    return ''.join(parts)
+
 
 class DynamicTaskManager:
     """
@@ -13,59 +75,108 @@ class DynamicTaskManager:
         self.tasks_config_path = tasks_config_path
         self.tasks_config = self._load_tasks_config()
         self.project_state = {}
+        # Append-only log of project_state changes; a state version is a position in it
+        self._state_log: List[Tuple[str, str, Any]] = []
         self.completed_tasks = []
+        # Rendered task context, reused until the state version or completion count moves
+        self._context_cache: Optional[Tuple[Tuple[int, int], str]] = None
+        self._status_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # Names of completed tasks, so state checks don't rescan completed_tasks
+        self.completed_task_names = set()
+        # Agents by config name, registered by the crew so dynamic tasks can be handed to them
+        self.agents: Dict[str, Any] = {}
         
-    def _load_tasks_config(self) -> Dict:
+    def _load_tasks_config(self) -> Mapping:
         """Load task configurations from YAML file."""
-        with open(self.tasks_config_path, 'r') as file:
-            return yaml.safe_load(file)
+        # Templates are only read here, so share the cached document instead of copying it
+        return load_yaml_config(self.tasks_config_path, readonly=True)
     
+    def register_agent(self, agent_name: str, agent: Any):
+        """Make an agent available to the tasks created for agent_name."""
+        self.agents[agent_name] = agent
+
     def update_project_state(self, state: Dict[str, Any]):
         """Update the current project state."""
         self.project_state.update(state)
+        # Logged as snapshots: later add_bug/add_feature calls append into these same objects
+        self._state_log.extend(('set', key, copy.deepcopy(value)) for key, value in state.items())
+
+    @property
+    def state_version(self) -> int:
+        """Version of project_state, bumped by every change made through this manager."""
+        return len(self._state_log)
+
+    def get_state_at(self, version: int) -> Dict[str, Any]:
+        """Rebuild project_state as it was at a given state version."""
+        state = {}
+        for op, key, value in self._state_log[:version]:
+            if op == 'set':
+                state[key] = value
+            else:
+                state[key] = [*state.get(key, []), *value]
+        # Callers get their own copy, so changing it cannot rewrite the log
+        return copy.deepcopy(state)
     
     def mark_task_completed(self, task_name: str, output: str):
         """Mark a task as completed with its output."""
+        # Interned so membership checks against the task-name constants hit on identity
+        task_name = sys.intern(task_name)
         self.completed_tasks.append({
             'name': task_name,
             'output': output,
-            'state': self.project_state.copy()
+            'state_version': self.state_version
         })
-    
-    def create_dynamic_task(self, task_template: str, **kwargs) -> Task:
+        self.completed_task_names.add(task_name)
+
+    def mark_tasks_completed_bulk(self, completions: List[Tuple[str, str]]):
+        """Mark several tasks as completed at once from (task_name, output) pairs."""
+        version = self.state_version
+        completions = [(sys.intern(task_name), output) for task_name, output in completions]
+        self.completed_tasks.extend(
+            {'name': task_name, 'output': output, 'state_version': version}
+            for task_name, output in completions
+        )
+        self.completed_task_names.update(task_name for task_name, _ in completions)
+
+    def create_dynamic_task(self, task_template: str, **kwargs) -> "Task":
         """Create a dynamic task based on a template with specific parameters."""
         if task_template not in self.tasks_config:
             raise ValueError(f"Task template '{task_template}' not found in configuration")
         
         template = self.tasks_config[task_template]
         
-        # Add default values for common template variables
-        default_params = {
-            'project_name': 'the project',
-            'bug_description': 'the reported issue',
-            'feature_description': 'the requested feature',
-            'research_topic': 'the technical topic',
-            'assigned_agent': 'staff_engineer'
-        }
-        
         # Merge default params with provided kwargs
-        format_params = {**default_params, **kwargs}
+        format_params = {**DEFAULT_TASK_PARAMS, **kwargs}
         
         # Format the description and expected_output with provided kwargs
-        description = template['description'].format(**format_params)
-        expected_output = template['expected_output'].format(**format_params)
+        description = _render_template(template['description'], format_params)
+        expected_output = _render_template(template['expected_output'], format_params)
         
         # Determine the agent based on the template or kwargs
         agent_name = kwargs.get('agent', template.get('agent', 'product_manager'))
+        if agent_name not in self.agents:
+            raise ValueError(f"Agent '{agent_name}' is not registered with the task manager")
         
+        from crewai import Task
+
+        # Task.context only takes other tasks, so the project summary travels in the description
         return Task(
-            description=description,
+            description=f"{description}\n\n{self._task_context()}",
             expected_output=expected_output,
-            agent=agent_name,
-            context=f"Project State: {self.project_state}\nCompleted Tasks: {len(self.completed_tasks)}"
+            agent=self.agents[agent_name]
         )
+
+    def _task_context(self) -> str:
+        """Render the project summary handed to dynamic tasks, once per state version."""
+        key = (self.state_version, len(self.completed_tasks))
+        if self._context_cache is None or self._context_cache[0] != key:
+            self._context_cache = (
+                key,
+                f"Project State: {self.project_state}\nCompleted Tasks: {len(self.completed_tasks)}"
+            )
+        return self._context_cache[1]
     
-    def determine_next_task(self, current_agent: str) -> Optional[Task]:
+    def determine_next_task(self, current_agent: str) -> Optional["Task"]:
         """
         Determine what task should be done next based on current project state.
         This is the core logic for dynamic task assignment.
@@ -79,45 +190,32 @@ class DynamicTaskManager:
         if not self._has_technical_architecture():
             return self.create_dynamic_task('technical_architecture_task')
         
+        has_implementation = self._has_implementation()
+        has_review = self._has_review()
+
         # Check if implementation is needed
-        if self._has_technical_architecture() and not self._has_implementation():
-            if current_agent == 'senior_engineer_frontend':
-                return self.create_dynamic_task('frontend_implementation_task')
-            elif current_agent == 'senior_engineer_backend':
-                return self.create_dynamic_task('backend_implementation_task')
-            elif current_agent == 'senior_engineer_devops':
-                return self.create_dynamic_task('devops_setup_task')
+        if not has_implementation and current_agent in IMPLEMENTATION_TASKS:
+            return self.create_dynamic_task(IMPLEMENTATION_TASKS[current_agent])
         
         # Check if review is needed
-        if self._has_implementation() and not self._has_review():
-            if current_agent == 'technical_skeptic':
-                return self.create_dynamic_task('technical_skeptic_review_task')
-            elif current_agent == 'staff_engineer':
-                return self.create_dynamic_task('code_review_task')
+        if has_implementation and not has_review and current_agent in REVIEW_TASKS:
+            return self.create_dynamic_task(REVIEW_TASKS[current_agent])
         
         # Check if integration is needed
-        if self._has_implementation() and self._has_review() and not self._has_integration():
+        if has_implementation and has_review and not self._has_integration():
             return self.create_dynamic_task('final_integration_task')
         
         # Check for bugs that need fixing
         bugs = self._get_pending_bugs()
-        if bugs and current_agent in ['senior_engineer_frontend', 'senior_engineer_backend']:
+        if bugs and current_agent in ISSUE_AGENTS:
             bug = bugs[0]  # Get the first pending bug
-            return self.create_dynamic_task(
-                'bug_fix_task',
-                bug_description=bug['description'],
-                assigned_agent=current_agent
-            )
+            return self.create_bug_fix_task(bug['description'], current_agent)
         
         # Check for features that need implementation
         features = self._get_pending_features()
-        if features and current_agent in ['senior_engineer_frontend', 'senior_engineer_backend']:
+        if features and current_agent in ISSUE_AGENTS:
             feature = features[0]  # Get the first pending feature
-            return self.create_dynamic_task(
-                'feature_implementation_task',
-                feature_description=feature['description'],
-                assigned_agent=current_agent
-            )
+            return self.create_feature_task(feature['description'], current_agent)
         
         # If no specific task is needed, ask for next steps
         if current_agent == 'product_manager':
@@ -125,7 +223,27 @@ class DynamicTaskManager:
         
         return None
     
-    def create_bug_fix_task(self, bug_description: str, assigned_agent: str) -> Task:
+    def assign_pending(self, agents: List[str]) -> List["Task"]:
+        """
+        Create tasks for every pending bug and then every pending feature in one pass,
+        handing them out round-robin across the given agents that take issue work.
+        """
+        eligible = [agent for agent in agents if agent in ISSUE_AGENTS]
+        if not eligible:
+            return []
+
+        assignees = itertools.cycle(eligible)
+        tasks = [
+            self.create_bug_fix_task(bug['description'], next(assignees))
+            for bug in self._get_pending_bugs()
+        ]
+        tasks.extend(
+            self.create_feature_task(feature['description'], next(assignees))
+            for feature in self._get_pending_features()
+        )
+        return tasks
+    
+    def create_bug_fix_task(self, bug_description: str, assigned_agent: str) -> "Task":
         """Create a specific bug fix task."""
         return self.create_dynamic_task(
             'bug_fix_task',
@@ -133,7 +251,7 @@ class DynamicTaskManager:
             agent=assigned_agent
         )
     
-    def create_feature_task(self, feature_description: str, assigned_agent: str) -> Task:
+    def create_feature_task(self, feature_description: str, assigned_agent: str) -> "Task":
         """Create a specific feature implementation task."""
         return self.create_dynamic_task(
             'feature_implementation_task',
@@ -141,7 +259,7 @@ class DynamicTaskManager:
             agent=assigned_agent
         )
     
-    def create_research_task(self, research_topic: str) -> Task:
+    def create_research_task(self, research_topic: str) -> "Task":
         """Create a technical research task."""
         return self.create_dynamic_task(
             'technical_research_task',
@@ -150,21 +268,19 @@ class DynamicTaskManager:
     
     # Helper methods to check project state
     def _has_market_research(self) -> bool:
-        return any(task['name'] == 'market_research_task' for task in self.completed_tasks)
+        return 'market_research_task' in self.completed_task_names
     
     def _has_technical_architecture(self) -> bool:
-        return any(task['name'] == 'technical_architecture_task' for task in self.completed_tasks)
+        return 'technical_architecture_task' in self.completed_task_names
     
     def _has_implementation(self) -> bool:
-        implementation_tasks = ['frontend_implementation_task', 'backend_implementation_task', 'devops_setup_task']
-        return any(task['name'] in implementation_tasks for task in self.completed_tasks)
+        return not self.completed_task_names.isdisjoint(IMPLEMENTATION_TASKS.values())
     
     def _has_review(self) -> bool:
-        review_tasks = ['technical_skeptic_review_task', 'code_review_task']
-        return any(task['name'] in review_tasks for task in self.completed_tasks)
+        return not self.completed_task_names.isdisjoint(REVIEW_TASKS.values())
     
     def _has_integration(self) -> bool:
-        return any(task['name'] == 'final_integration_task' for task in self.completed_tasks)
+        return 'final_integration_task' in self.completed_task_names
     
     def _get_pending_bugs(self) -> List[Dict]:
         """Get list of pending bugs from project state."""
@@ -176,33 +292,64 @@ class DynamicTaskManager:
     
     def add_bug(self, bug_description: str, priority: str = "medium", component: str = "unknown"):
         """Add a new bug to the project state."""
-        if 'pending_bugs' not in self.project_state:
-            self.project_state['pending_bugs'] = []
-        
-        self.project_state['pending_bugs'].append({
+        bug = {
             'description': bug_description,
             'priority': priority,
             'component': component,
             'status': 'pending'
-        })
+        }
+        self.project_state.setdefault('pending_bugs', []).append(bug)
+        self._state_log.append(('append', 'pending_bugs', [copy.deepcopy(bug)]))
     
     def add_feature(self, feature_description: str, priority: str = "medium", component: str = "unknown"):
         """Add a new feature request to the project state."""
-        if 'pending_features' not in self.project_state:
-            self.project_state['pending_features'] = []
-        
-        self.project_state['pending_features'].append({
+        feature = {
             'description': feature_description,
             'priority': priority,
             'component': component,
             'status': 'pending'
-        })
-    
+        }
+        self.project_state.setdefault('pending_features', []).append(feature)
+        self._state_log.append(('append', 'pending_features', [copy.deepcopy(feature)]))
+
+    def add_issues_bulk(self, issues: List[Tuple[str, str, str, str]]):
+        """
+        Add several bugs and feature requests at once.
+
+        Each issue is a (kind, description, priority, component) tuple where
+        kind is either "bug" or "feature".
+        """
+        queues = {'bug': [], 'feature': []}
+        for kind, description, priority, component in issues:
+            if kind not in queues:
+                raise ValueError(f"Unknown issue kind '{kind}', expected 'bug' or 'feature'")
+            queues[kind].append({
+                'description': description,
+                'priority': priority,
+                'component': component,
+                'status': 'pending'
+            })
+
+        if queues['bug']:
+            self.project_state.setdefault('pending_bugs', []).extend(queues['bug'])
+            self._state_log.append(('append', 'pending_bugs', copy.deepcopy(queues['bug'])))
+        if queues['feature']:
+            self.project_state.setdefault('pending_features', []).extend(queues['feature'])
+            self._state_log.append(('append', 'pending_features', copy.deepcopy(queues['feature'])))
+
     def get_project_status(self) -> Dict[str, Any]:
-        """Get current project status for agents to understand context."""
-        return {
-            'completed_tasks': [task['name'] for task in self.completed_tasks],
-            'pending_bugs': len(self._get_pending_bugs()),
-            'pending_features': len(self._get_pending_features()),
-            'project_state': self.project_state
-        } 
\ No newline at end of file
+        """
+        Get current project status for agents to understand context.
+
+        The same dict is returned until the state version or completion count moves,
+        so callers must not modify it.
+        """
+        key = (self.state_version, len(self.completed_tasks))
+        if self._status_cache is None or self._status_cache[0] != key:
+            self._status_cache = (key, {
+                'completed_tasks': [task['name'] for task in self.completed_tasks],
+                'pending_bugs': len(self._get_pending_bugs()),
+                'pending_features': len(self._get_pending_features()),
+                'project_state': self.project_state
+            })
+        return self._status_cache[1] 
\ No newline at end of file
@@ -0,0 +1,86 @@
+from typing import Dict, Optional, Any
+from pathlib import Path
+import hashlib
+import json
+import os
+import time
+
+from crewdev.settings import result_settings
+
+
+class KickoffCache:
+    """
+    On-disk cache of crew results keyed by the kickoff inputs and crew configuration.
+    """
+
+    def __init__(self, cache_dir: str = ".crewdev_cache", ttl_days: float = 7, max_mb: float = 100,
+                 config_dir: Path = Path(__file__).parent / "config"):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_secs = ttl_days * 24 * 60 * 60
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.config_dir = config_dir
+
+    def fingerprint(self, inputs: Dict[str, Any]) -> str:
+        """Hash the inputs together with the agent/task configuration and settings they run against."""
+        digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8"))
+        for name in ("agents.yaml", "tasks.yaml"):
+            digest.update((self.config_dir / name).read_bytes())
+        # Model, task limit, parallel mode, token cap and memory all change the result. They are
+        # resolved here rather than read from LLM_MODEL, which only exists once crewdev.crew is imported
+        digest.update(json.dumps(result_settings(), sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def load(self, inputs: Dict[str, Any], output_files: tuple = ()) -> Optional[str]:
+        """Return the cached raw result and restore its output files, or None on a miss."""
+        entry = self.cache_dir / self.fingerprint(inputs)
+        result_path = entry / "result.md"
+        try:
+            if time.time() - result_path.stat().st_mtime > self.ttl_secs:
+                return None
+            result = result_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        for output_file in output_files:
+            cached = entry / Path(output_file).name
+            if cached.exists():
+                self._atomic_write(Path(output_file), cached.read_bytes())
+        return result
+
+    def store(self, inputs: Dict[str, Any], result: str, output_files: tuple = ()) -> None:
+        """Store a raw result plus any output files the crew produced."""
+        entry = self.cache_dir / self.fingerprint(inputs)
+        entry.mkdir(parents=True, exist_ok=True)
+        for output_file in output_files:
+            source = Path(output_file)
+            if source.exists():
+                self._atomic_write(entry / source.name, source.read_bytes())
+        # Write the result last so a partially written entry is never a hit
+        self._atomic_write(entry / "result.md", result.encode("utf-8"))
+        self._evict()
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _evict(self) -> None:
+        """Drop the oldest entries until the cache fits within max_bytes."""
+        entries = []
+        total = 0
+        for entry in self.cache_dir.iterdir():
+            if not entry.is_dir():
+                continue
+            files = [f.stat() for f in entry.iterdir() if f.is_file()]
+            size = sum(st.st_size for st in files)
+            mtime = max((st.st_mtime for st in files), default=0)
+            entries.append((mtime, size, entry))
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for f in entry.iterdir():
+                f.unlink()
+            entry.rmdir()
+            total -= size
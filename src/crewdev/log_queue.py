@@ -0,0 +1,75 @@
+from typing import List
+from functools import lru_cache
+import atexit
+import logging
+import logging.handlers
+
+
+class BatchedStreamHandler(logging.StreamHandler):
+    """
+    Collects formatted records and writes them to the stream in one call on flush().
+
+    At most max_pending records are held; reaching it flushes early, so producers that
+    outpace the listener cannot grow the buffer without bound.
+    """
+
+    def __init__(self, stream=None, max_pending: int = 256):
+        super().__init__(stream)
+        self._pending: List[str] = []
+        self._max_pending = max_pending
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+            if len(self._pending) >= self._max_pending:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._pending:
+                self.stream.write("".join(self._pending))
+                self._pending.clear()
+            super().flush()
+        finally:
+            self.release()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Flushes its handlers only once the queue is drained, so a burst of records is one write."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+    def stop(self) -> None:
+        super().stop()
+        # The last records before the stop sentinel were never followed by an empty queue
+        for handler in self.handlers:
+            handler.flush()
+
+
+@lru_cache(maxsize=1)
+def shared_file_handler() -> BatchedStreamHandler:
+    """
+    The one handler writing crew_thought_process.log, opened on first use and closed at exit.
+
+    Root log records and agent thoughts both go through it, so they reach the file in
+    the order they were handled instead of as interleaved batches from separate handles.
+    """
+    stream = open('crew_thought_process.log', 'a', encoding='utf-8')
+    handler = BatchedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    def _close() -> None:
+        handler.flush()
+        handler.close()
+        stream.close()
+
+    # Registered before any listener's stop(), so it runs after they have flushed
+    atexit.register(_close)
+    return handler
@@ -1,29 +1,51 @@
 #!/usr/bin/env python
 import sys
 import warnings
+import atexit
 import logging
-import yaml
+import logging.handlers
+import queue
 from datetime import datetime
 
-from crewdev.crew import SoftwareEngineeringTeam
+from crewdev.kickoff_cache import KickoffCache
+from crewdev.log_queue import BatchedStreamHandler, BatchingQueueListener, shared_file_handler
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Banner rule used by the CLI entry points
+SEPARATOR = "=" * 60
+
+def _banner(*lines: str) -> None:
+    """Print a block of lines with one write, so log output from other threads can't split it."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+# Set once setup_logging has run; basicConfig ignores later calls anyway
+_LOGGING_CONFIGURED = False
+
 def setup_logging():
     """Setup detailed logging for the crew's thought process"""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGING_CONFIGURED = True
     try:
-        with open('src/crewdev/config/logging_config.yaml', 'r') as f:
-            log_config = yaml.safe_load(f)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('crew_thought_process.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # Library DEBUG traces go through a queue to a listener thread that batches the
+        # console and file writes, so the logging call itself never waits on I/O
+        # The file handler is shared with the crew's thought logger, so the log file is opened once
+        file_handler = shared_file_handler()
+        console_handler = BatchedStreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        listener = BatchingQueueListener(log_queue, file_handler, console_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # The queue handler only renders the message; the listener's handlers add the layout
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.DEBUG, handlers=[queue_handler])
         
         print("📝 Logging configured - thought process will be saved to 'crew_thought_process.log'")
 
@@ -42,7 +64,7 @@ def setup_logging():
                 pass
         
     except Exception as e:
-        print(f"⚠️ Warning: Could not load logging config: {e}")
+        print(f"⚠️ Warning: Could not configure logging: {e}")
         # Fallback to basic logging
         logging.basicConfig(
             level=logging.INFO,
@@ -57,14 +79,16 @@ def setup_logging():
 def run():
     """
     Run the software engineering team crew.
+
+    Returns the crew's final output as text (CrewOutput.raw), whether it was produced by this
+    run or reused from the kickoff cache, or None when the run is cancelled or stopped early.
     """
     setup_logging()
     
     import os
     # Optionally skip user prompts for debug runs
     skip_inputs = os.environ.get("CREWDEV_SKIP_INPUTS", "0").strip() in ("1", "true", "True")
-    print("🚀 Welcome to the Software Engineering Team!")
-    print("=" * 60)
+    _banner("🚀 Welcome to the Software Engineering Team!", SEPARATOR)
 
     if skip_inputs:
         project_name = os.environ.get("CREWDEV_PROJECT_NAME", "Debug Project")
@@ -107,15 +131,16 @@ def run():
         'current_year': str(datetime.now().year)
     }
     
-    print("\n" + "=" * 60)
-    print("📋 Project Summary:")
-    print(f"   🎯 Project: {project_name}")
+    summary = ["\n" + SEPARATOR, "📋 Project Summary:", f"   🎯 Project: {project_name}"]
     if project_description:
-        print(f"   📝 Description: {project_description}")
-    print(f"   👥 Target Users: {target_users}")
-    print(f"   ✨ Key Features: {key_features}")
-    print(f"   🔧 Tech Preferences: {tech_preferences}")
-    print("=" * 60)
+        summary.append(f"   📝 Description: {project_description}")
+    summary += [
+        f"   👥 Target Users: {target_users}",
+        f"   ✨ Key Features: {key_features}",
+        f"   🔧 Tech Preferences: {tech_preferences}",
+        SEPARATOR,
+    ]
+    _banner(*summary)
     
     # Confirm with user
     if not skip_inputs:
@@ -131,11 +156,23 @@ def run():
     except Exception:
         pass
 
-    print("\n🚀 Starting Software Engineering Team...")
-    print("📝 Thought process will be logged to 'crew_thought_process.log'")
-    print("=" * 60)
+    # Optionally reuse the result of an earlier run with identical inputs
+    use_cache = os.environ.get("CREWDEV_KICKOFF_CACHE", "0").strip() in ("1", "true", "True")
+    kickoff_cache = KickoffCache() if use_cache else None
+    if kickoff_cache:
+        cached = kickoff_cache.load(inputs, output_files=("project_deliverables.md",))
+        if cached is not None:
+            _banner("♻️ Reusing cached results for identical inputs (CREWDEV_KICKOFF_CACHE)",
+                    "📄 Check 'project_deliverables.md' for final deliverables")
+            return cached
+
+    _banner("\n🚀 Starting Software Engineering Team...",
+            "📝 Thought process will be logged to 'crew_thought_process.log'",
+            SEPARATOR)
 
     # Build crew explicitly so we can bootstrap logging and optionally stop before agent run
+    # (crewai is imported only here so cache hits and usage output stay fast)
+    from crewdev.crew import SoftwareEngineeringTeam
     team = SoftwareEngineeringTeam()
     crew_obj = team.crew()
 
@@ -143,22 +180,19 @@ def run():
     try:
         first_label = None
         try:
-            # Preferred: use team task order label if available
-            first_label = getattr(team, "_task_order", [["First Task", None]])[0][0]
+            # Preferred: the team's label for the crew's first task
+            first_label = getattr(team, "_task_labels", {}).get(crew_obj.tasks[0].name)
         except Exception:
             pass
         if not first_label:
             # Fallback: derive from first task description
             first_task = getattr(crew_obj, "tasks", [None])[0]
             if first_task and getattr(first_task, "description", None):
-                first_label = first_task.description.splitlines()[0][:100]
+                first_label = first_task.description.partition("\n")[0][:100]
             else:
                 first_label = "First Task"
         print(f"▶️ Starting {first_label} …")
-        try:
-            logging.info(f"Starting {first_label}")
-        except Exception:
-            pass
+        logging.info("Starting %s", first_label)
     except Exception:
         pass
 
@@ -169,11 +203,17 @@ def run():
         return None
 
     try:
-        result = crew_obj.kickoff(inputs=inputs)
-        print("=" * 60)
-        print("✅ Team work completed successfully!")
-        print("📄 Check 'crew_thought_process.log' for detailed thought process")
-        print("📄 Check 'project_deliverables.md' for final deliverables")
+        # Returned as text so a fresh run and a kickoff cache hit give callers the same type
+        result = crew_obj.kickoff(inputs=inputs).raw
+        if kickoff_cache:
+            try:
+                kickoff_cache.store(inputs, result, output_files=("project_deliverables.md",))
+            except Exception as e:
+                print(f"⚠️ Warning: Could not cache crew results: {e}")
+        _banner(SEPARATOR,
+                "✅ Team work completed successfully!",
+                "📄 Check 'crew_thought_process.log' for detailed thought process",
+                "📄 Check 'project_deliverables.md' for final deliverables")
         return result
     except Exception as e:
         print(f"❌ Error occurred while running the crew: {e}")
@@ -187,8 +227,7 @@ def train():
     setup_logging()
     
     # Prompt user for project details
-    print("🚀 Training the Software Engineering Team!")
-    print("=" * 60)
+    _banner("🚀 Training the Software Engineering Team!", SEPARATOR)
     
     # Get project name
     project_name = input("📋 What project should the team train on? (e.g., 'E-commerce Platform', 'Task Management App'): ").strip()
@@ -211,6 +250,7 @@ def train():
     print(f"\n🎯 Training on: {project_name}")
     
     try:
+        from crewdev.crew import SoftwareEngineeringTeam
         result = SoftwareEngineeringTeam().crew().train(n_iterations=int(sys.argv[2]), filename=sys.argv[3], inputs=inputs)
         print("✅ Training completed successfully!")
         return result
@@ -225,6 +265,7 @@ def replay():
     setup_logging()
     
     try:
+        from crewdev.crew import SoftwareEngineeringTeam
         result = SoftwareEngineeringTeam().crew().replay(task_id=sys.argv[2])
         print("✅ Replay completed successfully!")
         return result
@@ -239,8 +280,7 @@ def test():
     setup_logging()
     
     # Prompt user for project details
-    print("🧪 Testing the Software Engineering Team!")
-    print("=" * 60)
+    _banner("🧪 Testing the Software Engineering Team!", SEPARATOR)
     
     # Get project name
     project_name = input("📋 What project should the team test on? (e.g., 'E-commerce Platform', 'Task Management App'): ").strip()
@@ -263,6 +303,7 @@ def test():
     print(f"\n🧪 Testing on: {project_name}")
     
     try:
+        from crewdev.crew import SoftwareEngineeringTeam
         result = SoftwareEngineeringTeam().crew().test(n_iterations=int(sys.argv[2]), eval_llm=sys.argv[3], inputs=inputs)
         print("✅ Testing completed successfully!")
         return result
@@ -0,0 +1,68 @@
+from typing import Any, Dict, Optional
+import os
+
+# Settings read from the environment, kept free of crewai imports so the kickoff
+# cache can compute its key before the crew module is loaded.
+
+
+def _flag(name: str, default: str) -> bool:
+    return os.environ.get(name, default).strip() in ("1", "true", "True")
+
+
+def _positive_int(name: str) -> Optional[int]:
+    try:
+        value = os.environ.get(name)
+        if value:
+            return max(1, int(value))
+    except Exception:
+        pass
+    return None
+
+
+def ollama_model() -> str:
+    """Ollama model with the ollama/ prefix.
+
+    The default tag is a quantized build; set CREWDEV_OLLAMA_MODEL to pick another
+    model or quantization, e.g. "ollama/mistral:7b-instruct-q5_K_M".
+    """
+    return os.environ.get("CREWDEV_OLLAMA_MODEL", "ollama/mistral:latest")
+
+
+def max_tokens() -> Optional[int]:
+    """Optional cap on tokens generated per turn (CREWDEV_MAX_TOKENS)."""
+    return _positive_int("CREWDEV_MAX_TOKENS")
+
+
+def task_limit() -> Optional[int]:
+    """Optional limit on the number of tasks run, for faster debug iterations (CREWDEV_TASK_LIMIT)."""
+    return _positive_int("CREWDEV_TASK_LIMIT")
+
+
+def pause_enabled() -> bool:
+    """Whether to offer a pause after each task (CREWDEV_PAUSE_BETWEEN_TASKS)."""
+    return _flag("CREWDEV_PAUSE_BETWEEN_TASKS", "0")
+
+
+def parallel_tasks() -> bool:
+    """Whether the implementation tasks run concurrently (CREWDEV_PARALLEL_TASKS).
+
+    Pausing needs tasks to finish one at a time, otherwise concurrent callbacks
+    would prompt on stdin together.
+    """
+    return _flag("CREWDEV_PARALLEL_TASKS", "1") and not pause_enabled()
+
+
+def memory_enabled() -> bool:
+    """Whether crew memory is on (CREWDEV_MEMORY)."""
+    return _flag("CREWDEV_MEMORY", "1")
+
+
+def result_settings() -> Dict[str, Any]:
+    """Settings that change what a kickoff produces, as hashed into the kickoff cache key."""
+    return {
+        "model": ollama_model(),
+        "max_tokens": max_tokens(),
+        "task_limit": task_limit(),
+        "parallel_tasks": parallel_tasks(),
+        "memory": memory_enabled(),
+    }
@@ -1,45 +1,56 @@
-# File system tools
-from .file_tools import (
-    ReadFileTool,
-    WriteFileTool,
-    FileWriterTool,
-    ListDirectoryTool,
-    CreateDirectoryTool,
-    DeleteFileTool,
-    FileExistsTool
-)
+import importlib
 
-# Execution and server management tools
-from .execution_tools import (
-    RunCommandTool,
-    StartServerTool,
-    StopServerTool,
-    ListServersTool,
-    CheckPortTool,
-    InstallPackageTool,
-    RunPythonScriptTool
-)
+# Tools are imported from their module on first access (PEP 562), so importing one
+# tool module or the package does not pull in every other tool's dependencies
+_TOOL_MODULES = {
+    # File system tools
+    "ReadFileTool": ".file_tools",
+    "WriteFileTool": ".file_tools",
+    "FileWriterTool": ".file_tools",
+    "ListDirectoryTool": ".file_tools",
+    "CreateDirectoryTool": ".file_tools",
+    "DeleteFileTool": ".file_tools",
+    "FileExistsTool": ".file_tools",
 
-# Development environment tools
-from .dev_tools import (
-    CreateProjectTool,
-    CreateRequirementsTool,
-    CreatePackageJsonTool,
-    CreateDockerfileTool,
-    CreateDockerComposeTool,
-    CreateGitignoreTool
-)
+    # Execution and server management tools
+    "RunCommandTool": ".execution_tools",
+    "StartServerTool": ".execution_tools",
+    "StopServerTool": ".execution_tools",
+    "ListServersTool": ".execution_tools",
+    "CheckPortTool": ".execution_tools",
+    "InstallPackageTool": ".execution_tools",
+    "RunPythonScriptTool": ".execution_tools",
 
-# Legacy custom tool
-from .custom_tool import MyCustomTool
+    # Development environment tools
+    "CreateProjectTool": ".dev_tools",
+    "CreateRequirementsTool": ".dev_tools",
+    "CreatePackageJsonTool": ".dev_tools",
+    "CreateDockerfileTool": ".dev_tools",
+    "CreateDockerComposeTool": ".dev_tools",
+    "CreateGitignoreTool": ".dev_tools",
+
+    # Legacy custom tool
+    "MyCustomTool": ".custom_tool",
+
+    # Dynamic task management tools
+    "DynamicTaskTool": ".dynamic_task_tool",
+    "TaskCompletionTool": ".dynamic_task_tool",
+    "BugReportTool": ".dynamic_task_tool",
+    "FeatureRequestTool": ".dynamic_task_tool",
+}
+
+
+def __getattr__(name):
+    if name not in _TOOL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_TOOL_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOL_MODULES))
 
-# Dynamic task management tools
-from .dynamic_task_tool import (
-    DynamicTaskTool,
-    TaskCompletionTool,
-    BugReportTool,
-    FeatureRequestTool
-)
 
 # Export all tools
 __all__ = [
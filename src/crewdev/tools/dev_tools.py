@@ -1,11 +1,38 @@
 import json
-import yaml
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 
+# Service names that YAML can take as a plain key without reading it as a bool or null.
+# A leading letter rules out ints, floats and timestamps such as 123, 0x1f, 1_000 or 2024-01-01.
+_PLAIN_YAML_KEY = re.compile(r"[a-z][a-z0-9_.-]*")
+_YAML_RESERVED = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+
+def _yaml_key(key: str) -> str:
+    if _PLAIN_YAML_KEY.fullmatch(key) and key not in _YAML_RESERVED:
+        return key
+    # A JSON string is also a valid double-quoted YAML scalar
+    return json.dumps(key)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that text. Returns whether it wrote."""
+    try:
+        with open(path, 'r', newline='') as f:
+            if f.read() == content:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    # Written untranslated like the read above, so an unchanged file compares equal on Windows too
+    with open(path, 'w', newline='') as f:
+        f.write(content)
+    return True
+
+
 class CreateProjectInput(BaseModel):
     """Input schema for CreateProjectTool."""
     project_name: str = Field(..., description="Name of the project to create")
@@ -51,12 +78,12 @@ class CreateProjectTool(BaseTool):
         try:
             project_path = Path(project_name)
             
-            if project_path.exists():
+            # mkdir refuses an existing directory itself, without a separate exists() check
+            try:
+                project_path.mkdir(parents=True)
+            except FileExistsError:
                 return f"Error: Project directory '{project_name}' already exists"
             
-            # Create project directory
-            project_path.mkdir(parents=True)
-            
             # Create basic project structure based on type
             if project_type.lower() == "python":
                 self._create_python_project(project_path)
@@ -185,8 +212,8 @@ class CreateRequirementsTool(BaseTool):
     def _run(self, packages: List[str], filename: str = "requirements.txt") -> str:
         try:
             content = "\n".join(packages)
-            Path(filename).write_text(content)
-            return f"✅ Created requirements file '{filename}' with {len(packages)} packages"
+            wrote = _write_if_changed(Path(filename), content)
+            return f"✅ {'Created' if wrote else 'Unchanged'} requirements file '{filename}' with {len(packages)} packages"
         except Exception as e:
             return f"Error creating requirements file: {str(e)}"
 
@@ -215,8 +242,8 @@ class CreatePackageJsonTool(BaseTool):
                 "devDependencies": {dep: "latest" for dep in dev_dependencies}
             }
             
-            Path("package.json").write_text(json.dumps(package_json, indent=2))
-            return f"✅ Created package.json for '{project_name}'"
+            wrote = _write_if_changed(Path("package.json"), json.dumps(package_json, indent=2))
+            return f"✅ {'Created' if wrote else 'Unchanged'} package.json for '{project_name}'"
         except Exception as e:
             return f"Error creating package.json: {str(e)}"
 
@@ -243,8 +270,8 @@ EXPOSE 8000
 CMD ["python", "{entry_point}"]
 """
             
-            Path("Dockerfile").write_text(dockerfile_content)
-            return f"✅ Created Dockerfile with base image {base_image}"
+            wrote = _write_if_changed(Path("Dockerfile"), dockerfile_content)
+            return f"✅ {'Created' if wrote else 'Unchanged'} Dockerfile with base image {base_image}"
         except Exception as e:
             return f"Error creating Dockerfile: {str(e)}"
 
@@ -256,36 +283,29 @@ class CreateDockerComposeTool(BaseTool):
 
     def _run(self, services: List[str], ports: Dict[str, str] = {}) -> str:
         try:
-            compose_config = {
-                "version": "3.8",
-                "services": {}
-            }
-            
+            # The schema is fixed and tiny, so write the YAML directly instead of running an emitter
+            lines = ['version: "3.8"', "services:" if services else "services: {}"]
             for service in services:
-                compose_config["services"][service] = {
-                    "build": ".",
-                    "ports": [ports.get(service, "8000:8000")] if service in ports else [],
-                    "volumes": [".:/app"],
-                    "environment": ["PYTHONUNBUFFERED=1"]
-                }
+                lines.append(f"  {_yaml_key(service)}:")
+                lines.append("    build: .")
+                if service in ports:
+                    lines.append("    ports:")
+                    lines.append(f"      - {json.dumps(ports[service])}")
+                else:
+                    lines.append("    ports: []")
+                lines.append("    volumes:")
+                lines.append('      - ".:/app"')
+                lines.append("    environment:")
+                lines.append('      - "PYTHONUNBUFFERED=1"')
             
-            Path("docker-compose.yml").write_text(yaml.dump(compose_config, default_flow_style=False))
-            return f"✅ Created docker-compose.yml with {len(services)} services"
+            wrote = _write_if_changed(Path("docker-compose.yml"), "\n".join(lines) + "\n")
+            return f"✅ {'Created' if wrote else 'Unchanged'} docker-compose.yml with {len(services)} services"
         except Exception as e:
             return f"Error creating docker-compose.yml: {str(e)}"
 
 
-class CreateGitignoreTool(BaseTool):
-    name: str = "create_gitignore"
-    description: str = "Create a .gitignore file for common project types"
-    args_schema: type[BaseModel] = CreateProjectInput
-
-    def _run(self, project_name: str, project_type: str = "python", template: Optional[str] = None) -> str:
-        try:
-            gitignore_content = ""
-            
-            if project_type.lower() == "python":
-                gitignore_content = """# Byte-compiled / optimized / DLL files
+# .gitignore bodies written by CreateGitignoreTool, by project type
+_PYTHON_GITIGNORE = """# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -389,8 +409,8 @@ venv.bak/
 .dmypy.json
 dmypy.json
 """
-            elif project_type.lower() == "node":
-                gitignore_content = """# Dependencies
+
+_NODE_GITIGNORE = """# Dependencies
 node_modules/
 npm-debug.log*
 yarn-debug.log*
@@ -475,8 +495,8 @@ public
 tmp/
 temp/
 """
-            elif project_type.lower() == "react":
-                gitignore_content = """# See https://help.github.com/articles/ignoring-files/ for more about ignoring files.
+
+_REACT_GITIGNORE = """# See https://help.github.com/articles/ignoring-files/ for more about ignoring files.
 
 # dependencies
 /node_modules
@@ -500,14 +520,30 @@ npm-debug.log*
 yarn-debug.log*
 yarn-error.log*
 """
-            else:
-                gitignore_content = """# General
+
+_GENERIC_GITIGNORE = """# General
 .DS_Store
 .env
 *.log
 """
+
+_GITIGNORE_TEMPLATES = {
+    "python": _PYTHON_GITIGNORE,
+    "node": _NODE_GITIGNORE,
+    "react": _REACT_GITIGNORE,
+}
+
+
+class CreateGitignoreTool(BaseTool):
+    name: str = "create_gitignore"
+    description: str = "Create a .gitignore file for common project types"
+    args_schema: type[BaseModel] = CreateProjectInput
+
+    def _run(self, project_name: str, project_type: str = "python", template: Optional[str] = None) -> str:
+        try:
+            gitignore_content = _GITIGNORE_TEMPLATES.get(project_type.lower(), _GENERIC_GITIGNORE)
             
-            Path(".gitignore").write_text(gitignore_content)
-            return f"✅ Created .gitignore for {project_type} project"
+            wrote = _write_if_changed(Path(".gitignore"), gitignore_content)
+            return f"✅ {'Created' if wrote else 'Unchanged'} .gitignore for {project_type} project"
         except Exception as e:
             return f"Error creating .gitignore: {str(e)}" 
\ No newline at end of file
@@ -1,8 +1,17 @@
-from typing import Dict, Any, Optional
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
 import json
 
+# Engineer recommended for bugs and features by reported component
+_COMPONENT_AGENTS = {
+    **dict.fromkeys(('frontend', 'ui', 'react', 'typescript'), "senior_engineer_frontend"),
+    **dict.fromkeys(('backend', 'api', 'server', 'python', 'nodejs'), "senior_engineer_backend"),
+}
+
+
+def _recommended_agent(component: str) -> str:
+    # Default to staff engineer for unclear cases
+    return _COMPONENT_AGENTS.get(component.lower(), "staff_engineer")
+
 class DynamicTaskTool(BaseTool):
     """
     Tool for agents to request dynamic task assignment and report task completion.
@@ -38,18 +47,10 @@ class DynamicTaskTool(BaseTool):
             **kwargs: Additional parameters for the action
         """
         try:
-            if action == "get_next_task":
-                return self._get_next_task(**kwargs)
-            elif action == "report_completion":
-                return self._report_completion(**kwargs)
-            elif action == "add_bug":
-                return self._add_bug(**kwargs)
-            elif action == "add_feature":
-                return self._add_feature(**kwargs)
-            elif action == "get_status":
-                return self._get_status()
-            else:
-                return f"Unknown action: {action}. Available actions: get_next_task, report_completion, add_bug, add_feature, get_status"
+            handler = _DYNAMIC_TASK_ACTIONS.get(action)
+            if handler is None:
+                return f"Unknown action: {action}. Available actions: {', '.join(_DYNAMIC_TASK_ACTIONS)}"
+            return handler(self, **kwargs)
         except Exception as e:
             return f"Error executing action '{action}': {str(e)}"
     
@@ -76,10 +77,23 @@ class DynamicTaskTool(BaseTool):
         self._task_manager.add_feature(description, priority)
         return f"Feature request added to project: {description} (Priority: {priority})"
     
-    def _get_status(self) -> str:
-        """Get current project status."""
+    def _get_status(self, **kwargs) -> str:
+        """Get current project status. Extra arguments are ignored."""
         status = self._task_manager.get_project_status()
-        return json.dumps(status, indent=2)
+        # The manager hands back the same dict until the project state changes
+        cached = getattr(self, '_status_json', None)
+        if cached is None or cached[0] is not status:
+            cached = self._status_json = (status, json.dumps(status, indent=2))
+        return cached[1]
+
+# Handlers for DynamicTaskTool actions, in the order they are advertised
+_DYNAMIC_TASK_ACTIONS = {
+    "get_next_task": DynamicTaskTool._get_next_task,
+    "report_completion": DynamicTaskTool._report_completion,
+    "add_bug": DynamicTaskTool._add_bug,
+    "add_feature": DynamicTaskTool._add_feature,
+    "get_status": DynamicTaskTool._get_status,
+}
 
 class TaskCompletionTool(BaseTool):
     """
@@ -149,12 +163,7 @@ class BugReportTool(BaseTool):
             self._task_manager.add_bug(description, priority)
             
             # Determine which engineer should handle this bug
-            if component.lower() in ['frontend', 'ui', 'react', 'typescript']:
-                assigned_agent = "senior_engineer_frontend"
-            elif component.lower() in ['backend', 'api', 'server', 'python', 'nodejs']:
-                assigned_agent = "senior_engineer_backend"
-            else:
-                assigned_agent = "staff_engineer"  # Default to staff engineer for unclear cases
+            assigned_agent = _recommended_agent(component)
             
             return f"Bug reported and added to project:\nDescription: {description}\nPriority: {priority}\nComponent: {component}\nRecommended assignment: {assigned_agent}"
         except Exception as e:
@@ -189,12 +198,7 @@ class FeatureRequestTool(BaseTool):
             self._task_manager.add_feature(description, priority)
             
             # Determine which engineer should handle this feature
-            if component.lower() in ['frontend', 'ui', 'react', 'typescript']:
-                assigned_agent = "senior_engineer_frontend"
-            elif component.lower() in ['backend', 'api', 'server', 'python', 'nodejs']:
-                assigned_agent = "senior_engineer_backend"
-            else:
-                assigned_agent = "staff_engineer"  # Default to staff engineer for unclear cases
+            assigned_agent = _recommended_agent(component)
             
             return f"Feature request added to project:\nDescription: {description}\nPriority: {priority}\nComponent: {component}\nRecommended assignment: {assigned_agent}"
         except Exception as e:
@@ -1,14 +1,125 @@
+import atexit
 import subprocess
 import threading
-import time
+import re
+import shlex
 import signal
 import os
-import psutil
-from typing import Dict, List, Optional
+import sys
+import select
+import errno
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 
+# Anything the shell would interpret; commands without these can be exec'd directly
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`\\\"'*?\[\]~#{}!\n]")
+
+# A leading interpreter name in RunPythonScriptTool commands, e.g. "python" or "python3.11"
+_PYTHON_COMMAND = re.compile(r"python[\d.]*(?=\s|$)")
+
+
+# Shared pool for RunCommandTool.run_many; created on first use and reused afterwards
+_command_pool: Optional[ThreadPoolExecutor] = None
+_command_pool_lock = threading.Lock()
+
+
+def _get_command_pool() -> ThreadPoolExecutor:
+    global _command_pool
+    with _command_pool_lock:
+        if _command_pool is None:
+            # Default sizing (cpu count + 4): the workers mostly wait on child processes
+            _command_pool = ThreadPoolExecutor(thread_name_prefix="crewdev-cmd")
+        return _command_pool
+
+
+def _exits_within(process: subprocess.Popen, timeout: float) -> bool:
+    """Wait up to timeout seconds for process to exit, returning as soon as it does."""
+    try:
+        # A pidfd becomes readable when the process exits (Linux 5.3+)
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    try:
+        select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    return process.poll() is not None
+
+
+def _port_in_use(port: int) -> bool:
+    """Whether a local socket already holds port, answered by trying to bind it ourselves."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Same option servers set, so ports lingering in TIME_WAIT count as available
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(('127.0.0.1', port))
+            return False
+        except OSError as e:
+            if e.errno == errno.EADDRINUSE:
+                return True
+    # Could not bind for another reason (e.g. a privileged port): ask the port directly
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        return s.connect_ex(('localhost', port)) == 0
+
+
+def _listening_ports() -> Optional[frozenset]:
+    """Ports with a listening TCP socket, read from /proc/net/tcp{,6}; None where /proc is unavailable."""
+    ports = set()
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table, 'r') as f:
+                next(f, None)  # header
+                for line in f:
+                    fields = line.split()
+                    # fields[1] is local_address as HEXADDR:HEXPORT, fields[3] the state (0A = LISTEN)
+                    if len(fields) > 3 and fields[3] == '0A':
+                        ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+        except FileNotFoundError:
+            # tcp6 is absent when IPv6 is disabled; without tcp there is no /proc to read
+            if table == '/proc/net/tcp':
+                return None
+        except (OSError, ValueError):
+            return None
+    return frozenset(ports)
+
+
+# Servers started by StartServerTool, by name; shared by every start/stop/list tool instance
+_servers: Dict[str, subprocess.Popen] = {}
+
+# Indexed by "still running" (False/True) when listing servers
+_SERVER_STATUS = ("🔴 Stopped", "🟢 Running")
+
+
+def _stop_all_servers() -> None:
+    """Stop servers still running at interpreter exit so they don't outlive crewdev."""
+    for name, process in list(_servers.items()):
+        try:
+            if process.poll() is None:
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                if not _exits_within(process, 2):
+                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    process.wait()
+        except Exception:
+            # The group may already be gone; make sure the leader itself is reaped
+            try:
+                process.kill()
+                process.wait()
+            except Exception:
+                pass
+        _servers.pop(name, None)
+
+
+atexit.register(_stop_all_servers)
+
+
 class RunCommandInput(BaseModel):
     """Input schema for RunCommandTool."""
     command: str = Field(..., description="Command to execute")
@@ -46,21 +157,21 @@ class RunCommandTool(BaseTool):
 
     def _run(self, command: str, working_directory: str = ".", timeout: int = 300) -> str:
         try:
-            # Change to working directory
-            original_dir = os.getcwd()
-            os.chdir(working_directory)
-            
-            # Execute command
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            # Return to original directory
-            os.chdir(original_dir)
+            # Execute command in the working directory without touching the
+            # process-wide cwd, which is shared by concurrently running tasks
+            run_kwargs = dict(capture_output=True, text=True, timeout=timeout, cwd=working_directory)
+            result = None
+            argv = None if _SHELL_SYNTAX.search(command) else shlex.split(command)
+            if argv:
+                # Plain argv: skip the intermediate /bin/sh process
+                try:
+                    result = subprocess.run(argv, **run_kwargs)
+                except OSError:
+                    # Builtins, VAR=value prefixes, missing or non-executable programs:
+                    # let the shell handle them and report errors the way it always has
+                    result = None
+            if result is None:
+                result = subprocess.run(command, shell=True, **run_kwargs)
             
             output = f"Command: {command}\n"
             output += f"Working Directory: {working_directory}\n"
@@ -78,40 +189,42 @@ class RunCommandTool(BaseTool):
         except Exception as e:
             return f"Error executing command '{command}': {str(e)}"
 
+    @classmethod
+    def run_many(cls, calls: List[Dict[str, Any]]) -> List[str]:
+        """
+        Run several commands concurrently on a shared thread pool.
+
+        Each call is a dict of _run keyword arguments (command, working_directory, timeout).
+        Results are returned in the same order as the calls.
+        """
+        tool = cls()
+        return list(_get_command_pool().map(lambda kwargs: tool._run(**kwargs), calls))
+
 
 class StartServerTool(BaseTool):
     name: str = "start_server"
     description: str = "Start a server process in the background"
     args_schema: type[BaseModel] = StartServerInput
-    
-    # Class variable to track running servers
-    _servers: Dict[str, subprocess.Popen] = {}
 
     def _run(self, command: str, working_directory: str = ".", port: Optional[int] = None, server_name: str = "server") -> str:
         try:
             # Check if server is already running
-            if server_name in self._servers:
+            if server_name in _servers:
                 return f"Error: Server '{server_name}' is already running"
             
-            # Change to working directory
-            original_dir = os.getcwd()
-            os.chdir(working_directory)
-            
-            # Start server process
+            # Start server process in the working directory
             process = subprocess.Popen(
                 command,
                 shell=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                preexec_fn=os.setsid  # Create new process group
+                cwd=working_directory,
+                start_new_session=True  # setsid() in the child: own session and process group
             )
             
-            # Return to original directory
-            os.chdir(original_dir)
-            
             # Store server process
-            self._servers[server_name] = process
+            _servers[server_name] = process
             
             output = f"Started server '{server_name}' with PID {process.pid}\n"
             output += f"Command: {command}\n"
@@ -120,9 +233,8 @@ class StartServerTool(BaseTool):
             if port:
                 output += f"Port: {port}\n"
             
-            # Wait a moment to check if server started successfully
-            time.sleep(2)
-            if process.poll() is None:
+            # Give the server a moment to fail; a crash is reported as soon as it happens
+            if not _exits_within(process, 2):
                 output += "✅ Server is running"
             else:
                 output += "❌ Server failed to start"
@@ -139,27 +251,27 @@ class StopServerTool(BaseTool):
 
     def _run(self, server_name: str) -> str:
         try:
-            if server_name not in StartServerTool._servers:
+            if server_name not in _servers:
                 return f"Error: Server '{server_name}' is not running"
             
-            process = StartServerTool._servers[server_name]
+            process = _servers[server_name]
             
             # Try graceful shutdown first
             try:
                 os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                process.wait(timeout=10)
-                output = f"✅ Server '{server_name}' stopped gracefully"
-            except subprocess.TimeoutExpired:
-                # Force kill if graceful shutdown fails
-                os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                output = f"⚠️ Server '{server_name}' force stopped"
+                if _exits_within(process, 10):
+                    output = f"✅ Server '{server_name}' stopped gracefully"
+                else:
+                    # Force kill if graceful shutdown fails
+                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    output = f"⚠️ Server '{server_name}' force stopped"
             except Exception:
                 # Fallback to process.kill()
                 process.kill()
                 output = f"⚠️ Server '{server_name}' killed"
             
             # Remove from tracking
-            del StartServerTool._servers[server_name]
+            del _servers[server_name]
             
             return output
         except Exception as e:
@@ -173,12 +285,12 @@ class ListServersTool(BaseTool):
 
     def _run(self) -> str:
         try:
-            if not StartServerTool._servers:
+            if not _servers:
                 return "No servers are currently running"
             
             output = "Running servers:\n"
-            for name, process in StartServerTool._servers.items():
-                status = "🟢 Running" if process.poll() is None else "🔴 Stopped"
+            for name, process in _servers.items():
+                status = _SERVER_STATUS[process.poll() is None]
                 output += f"  {name}: PID {process.pid} - {status}\n"
             
             return output
@@ -193,17 +305,26 @@ class CheckPortTool(BaseTool):
 
     def _run(self, port: int) -> str:
         try:
-            import socket
-            
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                result = s.connect_ex(('localhost', port))
-                if result == 0:
-                    return f"Port {port} is in use"
-                else:
-                    return f"Port {port} is available"
+            if _port_in_use(port):
+                return f"Port {port} is in use"
+            else:
+                return f"Port {port} is available"
         except Exception as e:
             return f"Error checking port {port}: {str(e)}"
 
+    @classmethod
+    def check_ports(cls, ports: List[int]) -> Dict[int, bool]:
+        """
+        Check several ports at once, mapping each port to whether it is in use.
+
+        On Linux one read of the /proc TCP tables answers every port (listening sockets
+        only); elsewhere each port is probed like check_port does.
+        """
+        listening = _listening_ports()
+        if listening is None:
+            return {port: _port_in_use(port) for port in ports}
+        return {port: port in listening for port in ports}
+
 
 class InstallPackageTool(BaseTool):
     name: str = "install_package"
@@ -214,6 +335,9 @@ class InstallPackageTool(BaseTool):
         # Override command to ensure it's a pip install command
         if not command.startswith("pip install"):
             return "Error: This tool is for pip install commands only"
+
+        # Install into the interpreter RunPythonScriptTool runs scripts with, not the first pip on PATH
+        command = f"{shlex.quote(sys.executable)} -m pip{command[len('pip'):]}"
         
         return RunCommandTool()._run(command, working_directory, timeout)
 
@@ -224,8 +348,11 @@ class RunPythonScriptTool(BaseTool):
     args_schema: type[BaseModel] = RunCommandInput
 
     def _run(self, command: str, working_directory: str = ".", timeout: int = 300) -> str:
-        # Ensure it's a Python command
-        if not command.startswith("python") and not command.startswith("python3"):
-            command = f"python {command}"
+        # Run under this interpreter rather than whichever "python" PATH resolves to
+        command = command.strip()
+        match = _PYTHON_COMMAND.match(command)
+        if match:
+            command = command[match.end():].lstrip()
+        command = f"{shlex.quote(sys.executable)} {command}".rstrip()
         
         return RunCommandTool()._run(command, working_directory, timeout) 
\ No newline at end of file
@@ -1,7 +1,4 @@
 import os
-import json
-from pathlib import Path
-from typing import List, Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
@@ -45,14 +42,12 @@ class ReadFileTool(BaseTool):
 
     def _run(self, file_path: str) -> str:
         try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                return f"Error: File '{file_path}' does not exist"
-            
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
             return f"File '{file_path}' contents:\n{content}"
+        except FileNotFoundError:
+            return f"Error: File '{file_path}' does not exist"
         except Exception as e:
             return f"Error reading file '{file_path}': {str(e)}"
 
@@ -64,19 +59,16 @@ class WriteFileTool(BaseTool):
 
     def _run(self, file_path: str, content: str, overwrite: bool = True) -> str:
         try:
-            file_path = Path(file_path)
-            
             # Create parent directories if they don't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Check if file exists and overwrite flag
-            if file_path.exists() and not overwrite:
-                return f"Error: File '{file_path}' already exists and overwrite=False"
+            os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # Exclusive create refuses existing files without a separate exists() check
+            with open(file_path, 'w' if overwrite else 'x', encoding='utf-8') as f:
                 f.write(content)
-            
+
             return f"Successfully wrote {len(content)} characters to '{file_path}'"
+        except FileExistsError:
+            return f"Error: File '{file_path}' already exists and overwrite=False"
         except Exception as e:
             return f"Error writing file '{file_path}': {str(e)}"
 
@@ -98,17 +90,15 @@ class ListDirectoryTool(BaseTool):
 
     def _run(self, directory_path: str = ".") -> str:
         try:
-            directory_path = Path(directory_path)
-            if not directory_path.exists():
+            if not os.path.exists(directory_path):
                 return f"Error: Directory '{directory_path}' does not exist"
             
-            if not directory_path.is_dir():
+            if not os.path.isdir(directory_path):
                 return f"Error: '{directory_path}' is not a directory"
             
-            items = []
-            for item in directory_path.iterdir():
-                item_type = "📁" if item.is_dir() else "📄"
-                items.append(f"{item_type} {item.name}")
+            # scandir entries carry the file type from the directory read, so is_dir() needs no stat()
+            with os.scandir(directory_path) as entries:
+                items = [f"{'📁' if entry.is_dir() else '📄'} {entry.name}" for entry in entries]
             
             if not items:
                 return f"Directory '{directory_path}' is empty"
@@ -125,8 +115,7 @@ class CreateDirectoryTool(BaseTool):
 
     def _run(self, directory_path: str) -> str:
         try:
-            directory_path = Path(directory_path)
-            directory_path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(directory_path, exist_ok=True)
             return f"Successfully created directory '{directory_path}'"
         except Exception as e:
             return f"Error creating directory '{directory_path}': {str(e)}"
@@ -139,12 +128,11 @@ class DeleteFileTool(BaseTool):
 
     def _run(self, file_path: str) -> str:
         try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                return f"Error: File '{file_path}' does not exist"
-            
-            file_path.unlink()
+            # unlink reports a missing file itself, without a separate exists() check
+            os.unlink(file_path)
             return f"Successfully deleted file '{file_path}'"
+        except FileNotFoundError:
+            return f"Error: File '{file_path}' does not exist"
         except Exception as e:
             return f"Error deleting file '{file_path}': {str(e)}"
 
@@ -156,8 +144,7 @@ class FileExistsTool(BaseTool):
 
     def _run(self, file_path: str) -> str:
         try:
-            file_path = Path(file_path)
-            exists = file_path.exists()
+            exists = os.path.exists(file_path)
             return f"File '{file_path}' {'exists' if exists else 'does not exist'}"
         except Exception as e:
             return f"Error checking file '{file_path}': {str(e)}" 
\ No newline at end of file
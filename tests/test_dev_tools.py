@@ -0,0 +1,22 @@
+import pytest
+import yaml
+
+from crewdev.tools.dev_tools import _write_if_changed, _yaml_key
+
+
+@pytest.mark.parametrize("name", [
+    "web", "db", "api-gateway", "worker_1", "svc.internal",
+    "123", "0x1f", "1_000", "0o17", "1e3", "2024-01-01", "12:30",
+    "yes", "no", "on", "off", "true", "false", "null", "y", "n", "~",
+    "Web", "NULL", "True", "", " web", "-web", ".inf", ".nan", "<<", "=",
+])
+def test_yaml_key_reads_back_as_the_same_string(name):
+    assert yaml.safe_load(f"{_yaml_key(name)}: 1") == {name: 1}
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / "requirements.txt"
+    assert _write_if_changed(path, "crewai\nrequests\n")
+    assert path.read_bytes() == b"crewai\nrequests\n"
+    assert not _write_if_changed(path, "crewai\nrequests\n")
+    assert _write_if_changed(path, "crewai\n")
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+from crewai import Agent
+
+from crewdev.dynamic_task_manager import DynamicTaskManager, _render_template
+
+TASKS_CONFIG = Path(__file__).resolve().parents[1] / "src" / "crewdev" / "config" / "tasks.yaml"
+
+
+def _agent(role: str) -> Agent:
+    return Agent(role=role, goal="Fix issues", backstory="Engineer", llm="ollama/mistral:latest")
+
+
+@pytest.fixture
+def manager() -> DynamicTaskManager:
+    return DynamicTaskManager(str(TASKS_CONFIG))
+
+
+def test_assign_pending_alternates_agents(manager):
+    frontend = _agent("frontend")
+    backend = _agent("backend")
+    manager.register_agent("senior_engineer_frontend", frontend)
+    manager.register_agent("senior_engineer_backend", backend)
+    manager.add_issues_bulk([
+        ("bug", "login fails", "high", "frontend"),
+        ("bug", "api times out", "high", "backend"),
+        ("feature", "dark mode", "low", "frontend"),
+    ])
+
+    tasks = manager.assign_pending(["senior_engineer_frontend", "senior_engineer_backend", "staff_engineer"])
+
+    assert [task.agent for task in tasks] == [frontend, backend, frontend]
+    assert "login fails" in tasks[0].description
+    assert "dark mode" in tasks[2].description
+
+
+def test_assign_pending_without_issue_agents(manager):
+    manager.add_bug("login fails")
+    assert manager.assign_pending(["staff_engineer"]) == []
+
+
+def test_unregistered_agent_is_rejected(manager):
+    with pytest.raises(ValueError):
+        manager.create_bug_fix_task("login fails", "senior_engineer_frontend")
+
+
+def test_get_state_at_after_set_then_append(manager):
+    manager.update_project_state({"pending_bugs": []})
+    manager.add_bug("login fails")
+    manager.add_bug("api times out")
+
+    assert manager.get_state_at(0) == {}
+    assert manager.get_state_at(1) == {"pending_bugs": []}
+    assert [bug["description"] for bug in manager.get_state_at(2)["pending_bugs"]] == ["login fails"]
+    assert [bug["description"] for bug in manager.get_state_at(3)["pending_bugs"]] == ["login fails", "api times out"]
+
+
+def test_get_state_at_ignores_later_changes(manager):
+    manager.add_bug("login fails")
+    manager.project_state["pending_bugs"][0]["status"] = "fixed"
+    manager.get_state_at(1)["pending_bugs"].clear()
+
+    assert manager.get_state_at(1)["pending_bugs"][0]["status"] == "pending"
+
+
+@pytest.mark.parametrize("template", [
+    "Fix {bug_description} in {project_name}",
+    "{project_name!r:>20} {{literal}}",
+    "{x:{w}}",
+    "{params[key]}",
+])
+def test_render_template_matches_str_format(template):
+    params = {"bug_description": "login", "project_name": "shop", "x": 3.5, "w": 8, "params": {"key": "v"}}
+    assert _render_template(template, params) == template.format(**params)
+
+
+@pytest.mark.parametrize("template", ["{}", "{0}"])
+def test_render_template_raises_like_str_format(template):
+    with pytest.raises(IndexError):
+        _render_template(template, {"project_name": "shop"})